@@ -2,6 +2,8 @@
 FORD Score - Variable definitions for the input form.
 """
 
+from collections import OrderedDict
+
 MODEL_NAME = "FORD Score"
 
 RISK_LEVELS = [
@@ -136,3 +138,34 @@ VARIABLES = [
         "group": "Prehospital & Insurance",
     },
 ]
+
+
+def _build_groups() -> OrderedDict:
+    """Group VARIABLES by their form section, preserving declaration order."""
+    groups = OrderedDict()
+    for var in VARIABLES:
+        group = var.get("group", "General")
+        groups.setdefault(group, []).append(var)
+    return groups
+
+
+GROUPED_VARIABLES = _build_groups()
+
+
+def _as_widget_var(var: dict) -> dict:
+    """Copy of a variable with numeric constraints cast to float for st.number_input."""
+    if var["type"] != "continuous":
+        return var
+    return {**var, **{key: float(var[key]) for key in ("min", "max", "step", "default")}}
+
+
+# Form layout: group name -> list of (variable, column index) in a 2-column grid.
+GROUPED_VARIABLES_WITH_COL = OrderedDict(
+    (group, [(_as_widget_var(var), i % 2) for i, var in enumerate(group_vars)])
+    for group, group_vars in GROUPED_VARIABLES.items()
+)
+
+# Risk level for each possible score, so lookups are a direct index.
+RISK_LEVEL_BY_SCORE = [
+    next(level for level in RISK_LEVELS if score <= level["max_score"]) for score in range(11)
+]
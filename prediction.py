@@ -2,7 +2,147 @@
 FORD Score prediction engine.
 """
 
-from config import RISK_LEVELS, SCORE_RATES
+import numpy as np
+import pandas as pd
+
+from config import RISK_LEVEL_BY_SCORE, SCORE_RATES
+
+# Values used when a column is missing from compute_prediction_batch's input.
+_NUMERIC_DEFAULTS = {
+    "age": 50,
+    "gcs": 15,
+    "sbp": 120,
+    "hr": 75,
+    "rr": 16,
+    "height_in": 68,
+    "weight_lb": 170,
+}
+_CATEGORICAL_DEFAULTS = {
+    "sex": "Male",
+    "fracture_site": "Other",
+    "mechanism": "Fall",
+    "transport": "Ambulance/Air",
+    "insurance": "Self-pay",
+}
+
+
+def _one_of(name: str, *options: str) -> tuple:
+    """Test for a categorical rule: variable `name` takes one of `options`."""
+    return (name, frozenset(options))
+
+
+# Scoring rules as (label, condition, test, points). A test is either a
+# predicate over the dict of parsed input values or a categorical _one_of()
+# test. compute_prediction_batch reuses the predicates on NumPy arrays except
+# where _BATCH_PREDICATES overrides them.
+_RULES = (
+    ("GCS Severe (\u2264 8)", "GCS \u2264 8", lambda v: v["gcs"] <= 8, 6),
+    (
+        "Hip/Femur Fracture",
+        "Fracture site is Hip/Femur or Both",
+        _one_of("fracture_site", "Hip/Femur", "Both"),
+        5,
+    ),
+    ("Resp Rate Low (< 12)", "RR < 12", lambda v: v["rr"] < 12, 5),
+    ("Insurance: Medicare", "Insurance = Medicare", _one_of("insurance", "Medicare"), 4),
+    ("SBP Hypotensive (< 90)", "SBP < 90", lambda v: v["sbp"] < 90, 4),
+    ("Insurance: Other", "Insurance = Other", _one_of("insurance", "Other"), 4),
+    ("Age \u2265 75", "Age \u2265 75", lambda v: v["age"] >= 75, 3),
+    (
+        "Axial Fracture (Spine/Rib/Pelvis)",
+        "Fracture site is Axial or Both",
+        _one_of("fracture_site", "Axial (Spine/Rib/Pelvis)", "Both"),
+        3,
+    ),
+    ("Insurance: Private", "Insurance = Private", _one_of("insurance", "Private"), 3),
+    ("Insurance: Charity", "Insurance = Charity", _one_of("insurance", "Charity"), 3),
+    (
+        "GCS Moderate (9-12)",
+        "9 \u2264 GCS \u2264 12",
+        lambda v: 9 <= v["gcs"] <= 12,
+        3,
+    ),
+    ("BMI \u2265 40 (Class III Obesity)", "BMI \u2265 40", lambda v: v["bmi"] >= 40, 2),
+    ("Age 65-74", "65 \u2264 Age \u2264 74", lambda v: 65 <= v["age"] <= 74, 1),
+    ("Female", "Sex = Female", _one_of("sex", "Female"), 1),
+    ("Resp Rate High (> 20)", "RR > 20", lambda v: v["rr"] > 20, 1),
+    ("Heart Rate Tachycardic (\u2265 100)", "HR \u2265 100", lambda v: v["hr"] >= 100, 1),
+    (
+        "Transport: Private Vehicle",
+        "Transport = Private Vehicle",
+        _one_of("transport", "Private Vehicle"),
+        -2,
+    ),
+    ("Mechanism: Assault", "Mechanism = Assault", _one_of("mechanism", "Assault"), -3),
+    ("Transport: Walk-in", "Transport = Walk-in", _one_of("transport", "Walk-in"), -4),
+)
+
+
+# Array-safe predicates, by rule label, for rules whose chained comparisons
+# only work on scalars.
+_BATCH_PREDICATES = {
+    "GCS Moderate (9-12)": lambda v: (v["gcs"] >= 9) & (v["gcs"] <= 12),
+    "Age 65-74": lambda v: (v["age"] >= 65) & (v["age"] <= 74),
+}
+
+
+def _split_rules(rules: tuple) -> tuple:
+    """
+    Split rules into numeric predicates and per-variable categorical dispatch.
+
+    Returns:
+        (numeric, dispatch, masks) where numeric is a tuple of
+        (rule index, predicate), dispatch maps variable name -> option ->
+        tuple of indices of the rules that option satisfies, and masks maps
+        variable name -> option -> bitmask with bit i set for each such rule.
+    """
+    numeric = []
+    dispatch = {}
+    for i, (_, _, test, _) in enumerate(rules):
+        if callable(test):
+            numeric.append((i, test))
+            continue
+        name, options = test
+        for option in options:
+            dispatch.setdefault(name, {}).setdefault(option, []).append(i)
+    dispatch = {
+        name: {option: tuple(idx) for option, idx in table.items()}
+        for name, table in dispatch.items()
+    }
+    masks = {
+        name: {option: sum(1 << i for i in idx) for option, idx in table.items()}
+        for name, table in dispatch.items()
+    }
+    return tuple(numeric), dispatch, masks
+
+
+# compute_prediction walks the per-option index tuples; compute_prediction_batch
+# combines the bitmasks across rows.
+_NUMERIC_RULES, _CATEGORICAL_DISPATCH, _CATEGORICAL_MASKS = _split_rules(_RULES)
+_BATCH_NUMERIC_RULES = tuple(
+    (i, _BATCH_PREDICATES.get(_RULES[i][0], predicate)) for i, predicate in _NUMERIC_RULES
+)
+
+# Rule metadata in _RULES order, for rendering from a met/not-met mask.
+RULE_LABELS = tuple(label for label, _, _, _ in _RULES)
+RULE_CONDITIONS = tuple(condition for _, condition, _, _ in _RULES)
+RULE_POINTS = tuple(points for _, _, _, points in _RULES)
+
+RULE_POINTS_ARRAY = np.array(RULE_POINTS, dtype=np.int64)
+_RULE_BITS = np.arange(len(_RULES), dtype=np.int64)
+
+# Clamped score for every reachable raw score, indexed by raw_score - _MIN_RAW_SCORE.
+_MIN_RAW_SCORE = sum(points for points in RULE_POINTS if points < 0)
+_MAX_RAW_SCORE = sum(points for points in RULE_POINTS if points > 0)
+_CLIP_LUT = [max(0, min(10, raw)) for raw in range(_MIN_RAW_SCORE, _MAX_RAW_SCORE + 1)]
+_SCORE_RATES = np.array([SCORE_RATES.get(score, 0.0) for score in range(11)])
+_LEVEL_LABELS = np.array([level["label"] for level in RISK_LEVEL_BY_SCORE], dtype=object)
+_LEVEL_COLORS = np.array([level["color"] for level in RISK_LEVEL_BY_SCORE], dtype=object)
+_LEVEL_RATES = np.array([level["nonhome_rate"] for level in RISK_LEVEL_BY_SCORE])
+
+
+def _bmi(height_in, weight_lb):
+    return weight_lb * 703 / (height_in * height_in)
 
 
 def compute_prediction(inputs: dict) -> dict:
@@ -10,7 +150,8 @@ def compute_prediction(inputs: dict) -> dict:
     Compute the FORD score (0-10 scale) from raw input values.
 
     Args:
-        inputs: dict mapping variable name to its raw value.
+        inputs: dict mapping variable name to its raw value. A precomputed
+            "bmi" entry takes precedence over height_in/weight_lb.
 
     Returns:
         dict with keys:
@@ -20,163 +161,104 @@ def compute_prediction(inputs: dict) -> dict:
             - risk_label: risk level string
             - risk_color: color for display
             - risk_nonhome_pct: group-level non-home discharge %
-            - components: list of per-component contribution dicts
+            - components: list of (label, condition, met, points, value)
+              tuples, one per rule
     """
-    age = float(inputs.get("age", 50))
-    sex = inputs.get("sex", "Male")
-    gcs = float(inputs.get("gcs", 15))
-    sbp = float(inputs.get("sbp", 120))
-    hr = float(inputs.get("hr", 75))
-    rr = float(inputs.get("rr", 16))
-    height_in = float(inputs.get("height_in", 68))
-    weight_lb = float(inputs.get("weight_lb", 170))
-    bmi = (weight_lb / (height_in ** 2)) * 703
-    fracture_site = inputs.get("fracture_site", "Other")
-    mechanism = inputs.get("mechanism", "Fall")
-    transport = inputs.get("transport", "Ambulance/Air")
-    insurance = inputs.get("insurance", "Self-pay")
-
-    components = [
-        {
-            "label": "GCS Severe (\u2264 8)",
-            "condition": "GCS \u2264 8",
-            "met": gcs <= 8,
-            "points": 6,
-        },
-        {
-            "label": "Hip/Femur Fracture",
-            "condition": "Fracture site is Hip/Femur or Both",
-            "met": fracture_site in ("Hip/Femur", "Both"),
-            "points": 5,
-        },
-        {
-            "label": "Resp Rate Low (< 12)",
-            "condition": "RR < 12",
-            "met": rr < 12,
-            "points": 5,
-        },
-        {
-            "label": "Insurance: Medicare",
-            "condition": "Insurance = Medicare",
-            "met": insurance == "Medicare",
-            "points": 4,
-        },
-        {
-            "label": "SBP Hypotensive (< 90)",
-            "condition": "SBP < 90",
-            "met": sbp < 90,
-            "points": 4,
-        },
-        {
-            "label": "Insurance: Other",
-            "condition": "Insurance = Other",
-            "met": insurance == "Other",
-            "points": 4,
-        },
-        {
-            "label": "Age \u2265 75",
-            "condition": "Age \u2265 75",
-            "met": age >= 75,
-            "points": 3,
-        },
-        {
-            "label": "Axial Fracture (Spine/Rib/Pelvis)",
-            "condition": "Fracture site is Axial or Both",
-            "met": fracture_site in ("Axial (Spine/Rib/Pelvis)", "Both"),
-            "points": 3,
-        },
-        {
-            "label": "Insurance: Private",
-            "condition": "Insurance = Private",
-            "met": insurance == "Private",
-            "points": 3,
-        },
-        {
-            "label": "Insurance: Charity",
-            "condition": "Insurance = Charity",
-            "met": insurance == "Charity",
-            "points": 3,
-        },
-        {
-            "label": "GCS Moderate (9-12)",
-            "condition": "9 \u2264 GCS \u2264 12",
-            "met": 9 <= gcs <= 12,
-            "points": 3,
-        },
-        {
-            "label": "BMI \u2265 40 (Class III Obesity)",
-            "condition": "BMI \u2265 40",
-            "met": bmi >= 40,
-            "points": 2,
-        },
-        {
-            "label": "Age 65-74",
-            "condition": "65 \u2264 Age \u2264 74",
-            "met": 65 <= age <= 74,
-            "points": 1,
-        },
-        {
-            "label": "Female",
-            "condition": "Sex = Female",
-            "met": sex == "Female",
-            "points": 1,
-        },
-        {
-            "label": "Resp Rate High (> 20)",
-            "condition": "RR > 20",
-            "met": rr > 20,
-            "points": 1,
-        },
-        {
-            "label": "Heart Rate Tachycardic (\u2265 100)",
-            "condition": "HR \u2265 100",
-            "met": hr >= 100,
-            "points": 1,
-        },
-        {
-            "label": "Transport: Private Vehicle",
-            "condition": "Transport = Private Vehicle",
-            "met": transport == "Private Vehicle",
-            "points": -2,
-        },
-        {
-            "label": "Mechanism: Assault",
-            "condition": "Mechanism = Assault",
-            "met": mechanism == "Assault",
-            "points": -3,
-        },
-        {
-            "label": "Transport: Walk-in",
-            "condition": "Transport = Walk-in",
-            "met": transport == "Walk-in",
-            "points": -4,
-        },
-    ]
+    if "bmi" in inputs:
+        bmi = float(inputs["bmi"])
+    else:
+        bmi = _bmi(float(inputs.get("height_in", 68)), float(inputs.get("weight_lb", 170)))
+    v = {
+        "age": float(inputs.get("age", 50)),
+        "sex": inputs.get("sex", "Male"),
+        "gcs": float(inputs.get("gcs", 15)),
+        "sbp": float(inputs.get("sbp", 120)),
+        "hr": float(inputs.get("hr", 75)),
+        "rr": float(inputs.get("rr", 16)),
+        "bmi": bmi,
+        "fracture_site": inputs.get("fracture_site", "Other"),
+        "mechanism": inputs.get("mechanism", "Fall"),
+        "transport": inputs.get("transport", "Ambulance/Air"),
+        "insurance": inputs.get("insurance", "Self-pay"),
+    }
+
+    met_flags = [False] * len(_RULES)
+    for i, predicate in _NUMERIC_RULES:
+        met_flags[i] = predicate(v)
+    for name, table in _CATEGORICAL_DISPATCH.items():
+        for i in table.get(v[name], ()):
+            met_flags[i] = True
 
-    for comp in components:
-        comp["value"] = comp["points"] if comp["met"] else 0
+    raw_score = 0
+    components = []
+    for (label, condition, _, points), met in zip(_RULES, met_flags):
+        value = points if met else 0
+        raw_score += value
+        components.append((label, condition, met, points, value))
 
-    raw_score = sum(c["value"] for c in components)
-    score = max(0, min(10, raw_score))
+    score = _CLIP_LUT[raw_score - _MIN_RAW_SCORE]
 
     nonhome_pct = SCORE_RATES.get(score, 0.0)
 
-    risk_label = ""
-    risk_color = "green"
-    risk_nonhome_pct = 0.0
-    for level in RISK_LEVELS:
-        if score <= level["max_score"]:
-            risk_label = level["label"]
-            risk_color = level["color"]
-            risk_nonhome_pct = level["nonhome_rate"]
-            break
+    level = RISK_LEVEL_BY_SCORE[score]
 
     return {
         "score": score,
         "raw_score": raw_score,
         "nonhome_pct": nonhome_pct,
-        "risk_label": risk_label,
-        "risk_color": risk_color,
-        "risk_nonhome_pct": risk_nonhome_pct,
+        "risk_label": level["label"],
+        "risk_color": level["color"],
+        "risk_nonhome_pct": level["nonhome_rate"],
         "components": components,
     }
+
+
+def compute_prediction_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute FORD scores for many patients at once.
+
+    Args:
+        df: one row per patient, with columns named after the input variables.
+            Missing columns fall back to the same defaults as compute_prediction,
+            and a "bmi" column takes precedence over height_in/weight_lb.
+
+    Returns:
+        DataFrame aligned to df.index with columns:
+            score, raw_score, nonhome_pct, risk_label, risk_color, risk_nonhome_pct
+    """
+    v = {
+        name: df[name].to_numpy(dtype=float) if name in df else float(default)
+        for name, default in _NUMERIC_DEFAULTS.items()
+    }
+    v.update({
+        name: df[name].to_numpy(dtype=object) if name in df else default
+        for name, default in _CATEGORICAL_DEFAULTS.items()
+    })
+    if "bmi" in df:
+        v["bmi"] = df["bmi"].to_numpy(dtype=float)
+    else:
+        v["bmi"] = _bmi(v["height_in"], v["weight_lb"])
+
+    met = np.zeros((len(df), len(_RULES)), dtype=bool)
+    for i, predicate in _BATCH_NUMERIC_RULES:
+        met[:, i] = predicate(v)
+    categorical_hits = np.zeros(len(df), dtype=np.int64)
+    for name, table in _CATEGORICAL_MASKS.items():
+        for option, mask in table.items():
+            categorical_hits |= np.where(v[name] == option, mask, 0)
+    met |= (categorical_hits[:, None] >> _RULE_BITS & 1).astype(bool)
+
+    raw_score = met @ RULE_POINTS_ARRAY
+    score = np.clip(raw_score, 0, 10)
+
+    return pd.DataFrame(
+        {
+            "score": score,
+            "raw_score": raw_score,
+            "nonhome_pct": _SCORE_RATES[score],
+            "risk_label": _LEVEL_LABELS[score],
+            "risk_color": _LEVEL_COLORS[score],
+            "risk_nonhome_pct": _LEVEL_RATES[score],
+        },
+        index=df.index,
+    )
@@ -0,0 +1,156 @@
+"""
+Streamlit UI components for the FORD Score app.
+"""
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+from config import GROUPED_VARIABLES_WITH_COL, RISK_LEVELS, RISK_LEVEL_BY_SCORE
+from prediction import RULE_CONDITIONS, RULE_LABELS, RULE_POINTS, RULE_POINTS_ARRAY
+
+
+CURRENT_ROW_STYLE = "background-color: #d4edda; color: #155724"
+RULE_ORDER_BY_MAGNITUDE = tuple(sorted(range(len(RULE_POINTS)), key=lambda i: abs(RULE_POINTS[i])))
+
+
+def _build_reference_df() -> pd.DataFrame:
+    """Build the risk level reference table, one row per RISK_LEVELS entry."""
+    ref_rows = []
+    prev_max = -1
+    for level in RISK_LEVELS:
+        low = prev_max + 1
+        high = level["max_score"]
+        if low == high:
+            score_range = str(low)
+        else:
+            score_range = f"{low}\u2013{high}"
+        ref_rows.append({
+            "FORD Score": score_range,
+            "Risk Level": level["label"],
+            "Non-Home Discharge Rate": f"{level['nonhome_rate']}%",
+        })
+        prev_max = high
+    return pd.DataFrame(ref_rows)
+
+
+def _build_highlight_css(ref_df: pd.DataFrame, row: int) -> pd.DataFrame:
+    """CSS for the reference table with only `row` highlighted."""
+    css = pd.DataFrame("", index=ref_df.index, columns=ref_df.columns)
+    css.loc[row, :] = CURRENT_ROW_STYLE
+    return css
+
+
+# Static tables, built once when this module is first imported and shared by
+# every session; they are read-only.
+REF_DF = _build_reference_df()
+_REF_CSS_BY_ROW = [_build_highlight_css(REF_DF, row) for row in REF_DF.index]
+REF_CSS_BY_SCORE = [_REF_CSS_BY_ROW[RISK_LEVELS.index(level)] for level in RISK_LEVEL_BY_SCORE]
+
+
+def build_breakdown_df(met_mask: tuple) -> pd.DataFrame:
+    """Component breakdown table for a tuple of per-rule met flags."""
+    met = np.array(met_mask, dtype=bool)
+    return pd.DataFrame({
+        "Predictor": np.array(RULE_LABELS, dtype=object),
+        "Condition": np.array(RULE_CONDITIONS, dtype=object),
+        "Met?": np.where(met, "Yes", "No").astype(object),
+        "Points": np.where(met, RULE_POINTS_ARRAY, 0),
+    })
+
+
+def build_active_chart_df(met_mask: tuple) -> pd.DataFrame:
+    """Points of the met rules, ordered by magnitude and indexed by label."""
+    active = [i for i in RULE_ORDER_BY_MAGNITUDE if met_mask[i]]
+    return pd.DataFrame(
+        {"Points": [RULE_POINTS[i] for i in active]},
+        index=pd.Index([RULE_LABELS[i] for i in active], name="Component"),
+    )
+
+
+def render_about() -> None:
+    """Render the collapsible description of the score."""
+    with st.expander("About the FORD Score", expanded=False):
+        st.markdown(
+            "The **Fracture Orthopedic Risk of Discharge (FORD) Score** is a novel "
+            "bedside predictive tool for non-home discharge in orthopedic trauma patients.\n\n"
+            "It produces a score from **0–10** using patient demographics, ED vital signs, "
+            "injury characteristics, and prehospital/insurance factors. Higher scores indicate "
+            "greater risk of non-home discharge (e.g., rehab facility, skilled nursing).\n\n"
+            "**How to use:** Fill in the fields below, click **Calculate**, and review the "
+            "score, risk level, and component breakdown."
+        )
+
+
+def render_form() -> dict | None:
+    """
+    Render the grouped input form.
+
+    Returns:
+        dict mapping variable name to its entered value once the form is
+        submitted, otherwise None.
+    """
+    inputs = {}
+
+    with st.form("prediction_form"):
+        for group_name, group_vars in GROUPED_VARIABLES_WITH_COL.items():
+            with st.expander(group_name, expanded=True):
+                cols = st.columns(2)
+                for var, col_idx in group_vars:
+                    with cols[col_idx]:
+                        if var["type"] == "continuous":
+                            inputs[var["name"]] = st.number_input(
+                                var["label"],
+                                min_value=var["min"],
+                                max_value=var["max"],
+                                value=var["default"],
+                                step=var["step"],
+                                key=var["name"],
+                            )
+                        elif var["type"] == "categorical":
+                            selected = st.selectbox(
+                                var["label"],
+                                options=var["options"],
+                                key=var["name"],
+                            )
+                            inputs[var["name"]] = selected
+
+        submitted = st.form_submit_button("Calculate", type="primary", use_container_width=True)
+
+    return inputs if submitted else None
+
+
+def render_results(result: dict) -> None:
+    """Render the score, risk level reference table and component breakdown."""
+    score = result["score"]
+
+    # Static text for the summary and the reference heading goes out as one
+    # markdown element rather than one Streamlit command each.
+    st.markdown(
+        "---\n"
+        "### Result\n"
+        "| FORD Score (0-10) | Risk Level | Non-Home Discharge Risk |\n"
+        "|:---:|:---:|:---:|\n"
+        f"| **{score}** | :{result['risk_color']}[**{result['risk_label']}**] "
+        f"| **{result['nonhome_pct']}%** |\n\n"
+        "### Risk Level Reference"
+    )
+
+    # --- Risk level reference table ---
+    ref_css = REF_CSS_BY_SCORE[score]
+    st.dataframe(
+        REF_DF.style.apply(lambda _: ref_css, axis=None),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    # --- Component Breakdown ---
+    st.subheader("Component Breakdown")
+    met_mask = tuple(met for _, _, met, _, _ in result["components"])
+    st.dataframe(build_breakdown_df(met_mask), use_container_width=True, hide_index=True)
+
+    # --- Bar chart of active components ---
+    st.subheader("Active Components")
+    if any(met_mask):
+        st.bar_chart(build_active_chart_df(met_mask), horizontal=True)
+    else:
+        st.info("No risk factors are present with the current inputs.")